@@ -0,0 +1,3 @@
+from AutoSentinel.celery import app as celery_app
+
+__all__ = ['celery_app']
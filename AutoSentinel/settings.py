@@ -1,4 +1,6 @@
 import os
+import queue
+import re
 from pathlib import Path
 from datetime import timedelta
 
@@ -41,6 +43,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Compress API/HTML responses; JSON payloads shrink 5-10x.
+    # WhiteNoise statics below are already served precompressed.
+    'django.middleware.gzip.GZipMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -55,13 +61,20 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
          'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Parse each template once per process instead of per render;
+            # the admin changelist templates are the hottest ones.
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -72,13 +85,62 @@ WSGI_APPLICATION = 'AutoSentinel.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# WAL lets concurrent readers proceed while report/telemetry writes
+# commit; NORMAL sync drops the per-commit fsync cost.
+_SQLITE_INIT_COMMAND = (
+    'PRAGMA journal_mode=WAL;'
+    'PRAGMA synchronous=NORMAL;'
+    'PRAGMA temp_store=MEMORY;'
+    'PRAGMA mmap_size=268435456;'
+    'PRAGMA cache_size=-64000;'
+    'PRAGMA busy_timeout=30000;'
+)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+        # Reuse connections across requests instead of paying the
+        # open + PRAGMA replay cost on every request.
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': 30,
+            # The telemetry file is attached so cascades from Vehicle/User
+            # (whose delete collector runs on this connection) can reach
+            # the routed telemetry/audit/search tables.
+            'init_command': (
+                _SQLITE_INIT_COMMAND
+                + f'ATTACH DATABASE "{BASE_DIR / "telemetry.sqlite3"}" AS telemetrydb;'
+            ),
+        },
+    },
+    # High-write telemetry/audit tables live in their own file so their
+    # write bursts don't contend with vehicle/report commits (see
+    # main_application.routers.TelemetryRouter). Foreign keys back into
+    # the default database are unenforced cross-file references.
+    'telemetry': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'telemetry.sqlite3',
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'timeout': 30,
+            # Attaching the main file lets joins like
+            # AuditLog.objects.select_related('user', 'vehicle') keep
+            # working: SQLite resolves unqualified table names through
+            # attached databases.
+            'init_command': (
+                _SQLITE_INIT_COMMAND
+                + 'PRAGMA foreign_keys=OFF;'
+                + f'ATTACH DATABASE "{BASE_DIR / "db.sqlite3"}" AS appdb;'
+            ),
+        },
+    },
 }
 
+DATABASE_ROUTERS = ['main_application.routers.TelemetryRouter']
+
 # Custom User Model
 AUTH_USER_MODEL = 'main_application.User'
 
@@ -129,7 +191,11 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 # For WhiteNoise compression support (optional)
+# collectstatic emits .gz alongside each asset, and .br too when the
+# `brotli` package is installed — WhiteNoise picks whichever the client
+# accepts. Hashed filenames are immutable, so cache them for a year.
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+WHITENOISE_MAX_AGE = 31536000
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -139,21 +205,47 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # ============================================================================
 # CACHING CONFIGURATION (Redis)
 # ============================================================================
-# CACHES = {
-#     'default': {
-#         'BACKEND': 'django_redis.cache.RedisCache',
-#         'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/1'),
-#         'OPTIONS': {
-#             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-#             'CONNECTION_POOL_KWARGS': {
-#                 'max_connections': 50,
-#                 'retry_on_timeout': True,
-#             },
-#         },
-#         'KEY_PREFIX': 'autosentinel',
-#         'TIMEOUT': 300,
-#     }
-# }
+CACHES = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/1'),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # Cached search payloads round-trip as MessagePack: cheaper
+            # to encode/decode than pickled/JSON strings and smaller in
+            # Redis memory.
+            'SERIALIZER': 'django_redis.serializers.msgpack.MSGPackSerializer',
+            # Bounded blocking pool: sessions, throttles and the search
+            # cache share it instead of opening unbounded connections.
+            'CONNECTION_POOL_CLASS': 'redis.BlockingConnectionPool',
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': int(os.environ.get('REDIS_MAX_CONNECTIONS', '100')),
+                'timeout': float(os.environ.get('REDIS_BLOCKING_TIMEOUT', '1.0')),
+                'retry_on_timeout': True,
+            },
+        },
+        'KEY_PREFIX': 'autosentinel',
+        'TIMEOUT': 300,
+    },
+    # cache_page stores whole HttpResponse objects, which the msgpack
+    # serializer above can't encode — page caching goes through this
+    # alias with the default pickle serializer instead
+    'pages': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://localhost:6379/1'),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_CLASS': 'redis.BlockingConnectionPool',
+            'CONNECTION_POOL_KWARGS': {
+                'max_connections': int(os.environ.get('REDIS_MAX_CONNECTIONS', '100')),
+                'timeout': float(os.environ.get('REDIS_BLOCKING_TIMEOUT', '1.0')),
+                'retry_on_timeout': True,
+            },
+        },
+        'KEY_PREFIX': 'autosentinel-pages',
+        'TIMEOUT': 300,
+    },
+}
 
 
 # Session Configuration
@@ -168,6 +260,13 @@ CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localho
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
+# Bound broker/result connection fan-out so bursty beat ticks can't open
+# unbounded Redis connections.
+CELERY_BROKER_POOL_LIMIT = int(os.environ.get('CELERY_BROKER_POOL_LIMIT', '50'))
+CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
+# The Redis result backend caps its pool via redis_max_connections
+# (it ignores max_connections in transport options)
+CELERY_REDIS_MAX_CONNECTIONS = 50
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
@@ -200,16 +299,25 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'main_application.pagination.TimestampCursorPagination',
     'PAGE_SIZE': 20,
+    # orjson renderer/parser: large paginated payloads serialize several
+    # times faster than with the stdlib json default.
+    'DEFAULT_RENDERER_CLASSES': [
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'drf_orjson_renderer.parsers.ORJSONParser',
+    ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+        'main_application.throttling.PipelinedAnonRateThrottle',
+        'main_application.throttling.PipelinedUserRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/hour',
@@ -220,10 +328,19 @@ REST_FRAMEWORK = {
 }
 
 # JWT Settings
+# Ed25519 keys (PEM) can be supplied via the environment; verify is a
+# single libsodium-backed call and tokens are smaller than RS256. With
+# no keys configured we pin HS256 explicitly with a pre-loaded key.
+_JWT_SIGNING_KEY = os.environ.get('JWT_ED25519_PRIVATE_KEY', '')
+_JWT_VERIFYING_KEY = os.environ.get('JWT_ED25519_PUBLIC_KEY', '')
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
+    'ALGORITHM': 'EdDSA' if _JWT_SIGNING_KEY else 'HS256',
+    'SIGNING_KEY': _JWT_SIGNING_KEY or SECRET_KEY,
+    'VERIFYING_KEY': _JWT_VERIFYING_KEY,
 }
 
 # ============================================================================
@@ -275,26 +392,41 @@ TELEMETRY_DATA_RETENTION_DAYS = 90
 
 # Audit Logging
 AUDIT_LOG_RETENTION_DAYS = 365
-AUDIT_SENSITIVE_FIELDS = [
+# frozenset for O(1) membership tests on every audit write; the compiled
+# pattern is for matching sensitive names inside dotted field paths.
+AUDIT_SENSITIVE_FIELDS = frozenset({
     'owner_hash',
     'telemetry_traces',
     'latitude',
     'longitude',
-]
+})
+AUDIT_SENSITIVE_FIELDS_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(AUDIT_SENSITIVE_FIELDS))) + r')\b'
+)
 
 # Role Permissions
+# frozensets so the per-request "perm in ROLE_PERMISSIONS[role]" check is
+# a hash lookup instead of a list scan.
 ROLE_PERMISSIONS = {
-    'guest': ['view_basic_report'],
-    'verified_buyer': ['view_basic_report', 'view_full_report', 'purchase_report'],
-    'dealer': ['view_basic_report', 'view_full_report', 'purchase_report', 'bulk_search'],
-    'fleet_admin': ['view_basic_report', 'view_full_report', 'view_telemetry', 'manage_fleet'],
-    'auditor': ['view_all_reports', 'view_audit_logs'],
-    'system_admin': ['full_access'],
+    'guest': frozenset({'view_basic_report'}),
+    'verified_buyer': frozenset({'view_basic_report', 'view_full_report', 'purchase_report'}),
+    'dealer': frozenset({'view_basic_report', 'view_full_report', 'purchase_report', 'bulk_search'}),
+    'fleet_admin': frozenset({'view_basic_report', 'view_full_report', 'view_telemetry', 'manage_fleet'}),
+    'auditor': frozenset({'view_all_reports', 'view_audit_logs'}),
+    'system_admin': frozenset({'full_access'}),
 }
 
 # File Upload Settings
 DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760
+# The memory handler keeps uploads up to 1MB in RAM and hands anything
+# larger to the temp-file handler to stream to disk; keeps RSS flat
+# under concurrent report/PDF uploads without touching disk for small
+# form posts.
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1048576  # 1MB
+FILE_UPLOAD_HANDLERS = [
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
 
 # Email Configuration (for notifications)
 # EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
@@ -306,6 +438,17 @@ FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760
 # DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@autosentinel.com')
 
 # Logging Configuration
+# Precomputed once so LOGGING construction doesn't allocate Path objects;
+# the logs directory itself is created in MainApplicationConfig.ready().
+LOG_FILE_PATH = str(BASE_DIR / 'logs' / 'autosentinel.log')
+
+# Request handlers only enqueue records; a QueueListener started in
+# MainApplicationConfig.ready() drains the queue into the rotating file,
+# keeping disk I/O and rotation stalls off the request path.
+LOGGING_QUEUE = queue.Queue(-1)
+LOG_FILE_MAX_BYTES = 1024 * 1024 * 10  # 10MB
+LOG_FILE_BACKUP_COUNT = 5
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -320,32 +463,32 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
-        'file': {
-            'class': 'logging.handlers.RotatingFileHandler',
-            'filename': BASE_DIR / 'logs' / 'autosentinel.log',
-            'maxBytes': 1024 * 1024 * 10,  # 10MB
-            'backupCount': 5,
-            'formatter': 'verbose',
+        'file_queue': {
+            'class': 'logging.handlers.QueueHandler',
+            'queue': LOGGING_QUEUE,
         },
     },
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['console', 'file_queue'],
         'level': 'INFO',
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['console', 'file_queue'],
             'level': 'INFO',
             'propagate': False,
         },
+        'django.db.backends': {
+            # Avoid logging every SQL statement when DEBUG is on
+            'handlers': ['console', 'file_queue'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
         'core': {
-            'handlers': ['console', 'file'],
+            'handlers': ['console', 'file_queue'],
             'level': 'DEBUG' if DEBUG else 'INFO',
             'propagate': False,
         },
     },
 }
 
-# Create logs directory if it doesn't exist
-(BASE_DIR / 'logs').mkdir(exist_ok=True)
-
@@ -7,7 +7,12 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
 from django.urls import reverse
-from django.db.models import Count, Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+from django.db.models import CharField, Count, DurationField, ExpressionWrapper, F, Func, Q, Value
+from django.db.models.functions import Cast, Substr
+from main_application.paginators import EstimatedCountPaginator
 from main_application.models import (
     User, Vehicle, VehicleRegistration, TitleEvent, AccidentRecord,
     MileageRecord, OwnershipRecord, TheftRecord, TelemetryTrace,
@@ -16,6 +21,19 @@ from main_application.models import (
 )
 
 
+class VehicleVinAdminMixin:
+    """Shared VIN column for admins whose rows hang off a Vehicle.
+
+    A single @admin.display definition instead of a copy per admin; the
+    ordering hook makes the column sortable DB-side, and together with
+    list_select_related the attribute read is already prefetched.
+    """
+
+    @admin.display(description='VIN', ordering='vehicle__vin')
+    def vehicle_vin(self, obj):
+        return obj.vehicle.vin
+
+
 # ============================================================================
 # USER ADMIN
 # ============================================================================
@@ -58,6 +76,13 @@ class VehicleRegistrationInline(admin.TabularInline):
     fields = ['plate_number', 'state', 'country', 'issued_date', 'expiry_date', 'is_current']
     readonly_fields = ['created_at']
 
+    def get_queryset(self, request):
+        # Only pull the columns the inline actually renders
+        return super().get_queryset(request).only(
+            'id', 'vehicle', 'plate_number', 'state', 'country',
+            'issued_date', 'expiry_date', 'is_current', 'created_at'
+        )
+
 
 class TitleEventInline(admin.TabularInline):
     model = TitleEvent
@@ -66,6 +91,12 @@ class TitleEventInline(admin.TabularInline):
     readonly_fields = ['created_at']
     ordering = ['-event_date']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id', 'vehicle', 'event_type', 'event_date', 'title_status',
+            'state', 'odometer_reading', 'source', 'created_at'
+        )
+
 
 class AccidentRecordInline(admin.TabularInline):
     model = AccidentRecord
@@ -74,6 +105,12 @@ class AccidentRecordInline(admin.TabularInline):
     readonly_fields = ['created_at']
     ordering = ['-accident_date']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id', 'vehicle', 'accident_date', 'severity', 'source',
+            'estimated_damage_cost', 'airbag_deployed', 'verified', 'created_at'
+        )
+
 
 @admin.register(Vehicle)
 class VehicleAdmin(admin.ModelAdmin):
@@ -158,9 +195,11 @@ class VehicleAdmin(admin.ModelAdmin):
 @admin.register(VehicleRegistration)
 class VehicleRegistrationAdmin(admin.ModelAdmin):
     list_display = ['plate_number', 'state', 'country', 'vehicle_link', 'issued_date', 'expiry_date', 'is_current']
+    list_select_related = ('vehicle',)
     list_filter = ['state', 'country', 'is_current']
     search_fields = ['plate_number', 'vehicle__vin']
     readonly_fields = ['id', 'created_at']
+    autocomplete_fields = ('vehicle',)
     
     def vehicle_link(self, obj):
         url = reverse('admin:main_application_vehicle_change', args=[obj.vehicle.id])
@@ -173,25 +212,28 @@ class VehicleRegistrationAdmin(admin.ModelAdmin):
 # ============================================================================
 
 @admin.register(TitleEvent)
-class TitleEventAdmin(admin.ModelAdmin):
+class TitleEventAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
+    show_full_result_count = False
     list_display = ['vehicle_vin', 'event_type', 'event_date', 'title_status', 'state', 'odometer_reading', 'source']
+    list_select_related = ('vehicle',)
     list_filter = ['event_type', 'title_status', 'state', 'event_date']
     search_fields = ['vehicle__vin', 'title_number']
     readonly_fields = ['id', 'created_at']
+    autocomplete_fields = ('vehicle',)
     date_hierarchy = 'event_date'
-    
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
+
 
 
 @admin.register(AccidentRecord)
-class AccidentRecordAdmin(admin.ModelAdmin):
+class AccidentRecordAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
+    show_full_result_count = False
     list_display = ['vehicle_vin', 'accident_date', 'severity', 'source', 'damage_cost', 
                     'airbag_deployed', 'structural_damage', 'verified_badge']
+    list_select_related = ('vehicle',)
     list_filter = ['severity', 'source', 'verified', 'airbag_deployed', 'is_structural_damage', 'accident_date']
     search_fields = ['vehicle__vin', 'report_number', 'damage_description']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    autocomplete_fields = ('vehicle',)
     date_hierarchy = 'accident_date'
     
     fieldsets = (
@@ -216,10 +258,6 @@ class AccidentRecordAdmin(admin.ModelAdmin):
         }),
     )
     
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
-    
     def damage_cost(self, obj):
         if obj.estimated_damage_cost:
             return f'${obj.estimated_damage_cost:,.2f}'
@@ -238,17 +276,16 @@ class AccidentRecordAdmin(admin.ModelAdmin):
 
 
 @admin.register(MileageRecord)
-class MileageRecordAdmin(admin.ModelAdmin):
+class MileageRecordAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
+    show_full_result_count = False
     list_display = ['vehicle_vin', 'recorded_date', 'mileage', 'unit', 'source', 'rollback_flag', 'verified']
+    list_select_related = ('vehicle',)
     list_filter = ['source', 'is_rollback_suspected', 'verified', 'recorded_date']
     search_fields = ['vehicle__vin']
     readonly_fields = ['id', 'created_at']
+    autocomplete_fields = ('vehicle',)
     date_hierarchy = 'recorded_date'
     
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
-    
     def rollback_flag(self, obj):
         if obj.is_rollback_suspected:
             return format_html('<span style="color: red; font-weight: bold;">⚠ SUSPECTED</span>')
@@ -257,16 +294,14 @@ class MileageRecordAdmin(admin.ModelAdmin):
 
 
 @admin.register(OwnershipRecord)
-class OwnershipRecordAdmin(admin.ModelAdmin):
+class OwnershipRecordAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
     list_display = ['vehicle_vin', 'owner_sequence', 'owner_type', 'ownership_start', 
                     'ownership_end', 'duration_days', 'is_current', 'tracking_consent']
+    list_select_related = ('vehicle',)
     list_filter = ['owner_type', 'is_current', 'consented_to_tracking', 'state']
     search_fields = ['vehicle__vin', 'owner_hash']
     readonly_fields = ['id', 'created_at']
-    
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
+    autocomplete_fields = ('vehicle',)
     
     def duration_days(self, obj):
         return obj.ownership_duration_days or '-'
@@ -278,18 +313,16 @@ class OwnershipRecordAdmin(admin.ModelAdmin):
 
 
 @admin.register(TheftRecord)
-class TheftRecordAdmin(admin.ModelAdmin):
+class TheftRecordAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
     list_display = ['vehicle_vin', 'status', 'reported_date', 'recovered_date', 
                     'reporting_agency', 'case_number', 'location']
+    list_select_related = ('vehicle',)
     list_filter = ['status', 'reported_date', 'theft_location_state']
     search_fields = ['vehicle__vin', 'case_number', 'reporting_agency']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    autocomplete_fields = ('vehicle',)
     date_hierarchy = 'reported_date'
     
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
-    
     def location(self, obj):
         parts = [obj.theft_location_city, obj.theft_location_state]
         return ', '.join(filter(None, parts)) or '-'
@@ -300,17 +333,16 @@ class TheftRecordAdmin(admin.ModelAdmin):
 # ============================================================================
 
 @admin.register(TelemetryTrace)
-class TelemetryTraceAdmin(admin.ModelAdmin):
+class TelemetryTraceAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
+    show_full_result_count = False
     list_display = ['vehicle_vin', 'timestamp', 'location', 'speed', 'odometer', 'device_id']
+    list_select_related = ('vehicle',)
     list_filter = ['timestamp']
     search_fields = ['vehicle__vin', 'device_id']
     readonly_fields = ['id', 'created_at']
+    autocomplete_fields = ('vehicle',)
     date_hierarchy = 'timestamp'
     
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
-    
     def location(self, obj):
         return f'{obj.latitude}, {obj.longitude}'
 
@@ -320,12 +352,15 @@ class TelemetryTraceAdmin(admin.ModelAdmin):
 # ============================================================================
 
 @admin.register(CrowdsourcedReport)
-class CrowdsourcedReportAdmin(admin.ModelAdmin):
+class CrowdsourcedReportAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
+    show_full_result_count = False
     list_display = ['vehicle_vin', 'report_type', 'status', 'report_date', 
                     'submitted_by', 'location', 'verified_by_user']
+    list_select_related = ('vehicle', 'submitted_by', 'verified_by')
     list_filter = ['report_type', 'status', 'report_date']
     search_fields = ['vehicle__vin', 'description']
     readonly_fields = ['id', 'created_at', 'updated_at']
+    autocomplete_fields = ('vehicle', 'submitted_by', 'verified_by')
     date_hierarchy = 'report_date'
     
     fieldsets = (
@@ -346,10 +381,6 @@ class CrowdsourcedReportAdmin(admin.ModelAdmin):
     
     actions = ['verify_reports', 'reject_reports']
     
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
-    
     def location(self, obj):
         parts = [obj.location_city, obj.location_state]
         return ', '.join(filter(None, parts)) or '-'
@@ -377,16 +408,20 @@ class CrowdsourcedReportAdmin(admin.ModelAdmin):
 class ReportPurchaseInline(admin.StackedInline):
     model = ReportPurchase
     extra = 0
+    autocomplete_fields = ('user',)
     readonly_fields = ['id', 'created_at', 'completed_at']
 
 
 @admin.register(VehicleReport)
-class VehicleReportAdmin(admin.ModelAdmin):
+class VehicleReportAdmin(VehicleVinAdminMixin, admin.ModelAdmin):
+    show_full_result_count = False
     list_display = ['report_id', 'vehicle_vin', 'requested_by', 'status', 
                     'is_paid', 'price', 'created_date', 'generation_time']
+    list_select_related = ('vehicle', 'requested_by')
     list_filter = ['status', 'is_paid', 'include_telemetry', 'created_at']
     search_fields = ['id', 'vehicle__vin', 'requested_by__username']
     readonly_fields = ['id', 'created_at', 'updated_at', 'generation_started_at', 'generation_completed_at']
+    autocomplete_fields = ('vehicle', 'requested_by')
     
     fieldsets = (
         ('Report Information', {
@@ -413,22 +448,25 @@ class VehicleReportAdmin(admin.ModelAdmin):
     
     inlines = [ReportPurchaseInline]
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            gen_duration=ExpressionWrapper(
+                F('generation_completed_at') - F('generation_started_at'),
+                output_field=DurationField()
+            )
+        )
+    
     def report_id(self, obj):
         return str(obj.id)[:8]
     report_id.short_description = 'Report ID'
     
-    def vehicle_vin(self, obj):
-        return obj.vehicle.vin
-    vehicle_vin.short_description = 'VIN'
-    
     def created_date(self, obj):
         return obj.created_at.strftime('%Y-%m-%d %H:%M')
     created_date.short_description = 'Created'
     
     def generation_time(self, obj):
-        if obj.generation_started_at and obj.generation_completed_at:
-            delta = obj.generation_completed_at - obj.generation_started_at
-            return f'{delta.total_seconds():.2f}s'
+        if obj.gen_duration is not None:
+            return f'{obj.gen_duration.total_seconds():.2f}s'
         return '-'
     generation_time.short_description = 'Gen Time'
 
@@ -437,9 +475,11 @@ class VehicleReportAdmin(admin.ModelAdmin):
 class ReportPurchaseAdmin(admin.ModelAdmin):
     list_display = ['purchase_id', 'report_link', 'user', 'amount', 
                     'payment_status', 'payment_method', 'created_date']
+    list_select_related = ('report', 'user')
     list_filter = ['payment_status', 'payment_method', 'created_at']
     search_fields = ['id', 'user__username', 'transaction_id']
     readonly_fields = ['id', 'created_at', 'completed_at']
+    autocomplete_fields = ('report', 'user')
     
     def purchase_id(self, obj):
         return str(obj.id)[:8]
@@ -464,11 +504,11 @@ class DataProviderAdmin(admin.ModelAdmin):
     list_display = ['name', 'provider_type', 'is_active', 'rate_limit', 'api_status']
     list_filter = ['provider_type', 'is_active']
     search_fields = ['name']
-    readonly_fields = ['id', 'created_at', 'updated_at']
+    readonly_fields = ['id_display', 'created_at', 'updated_at']
     
     fieldsets = (
         ('Provider Information', {
-            'fields': ('id', 'name', 'provider_type', 'is_active')
+            'fields': ('id_display', 'name', 'provider_type', 'is_active')
         }),
         ('API Configuration', {
             'fields': ('api_endpoint', 'api_key', 'api_secret', 'rate_limit_per_hour')
@@ -483,23 +523,47 @@ class DataProviderAdmin(admin.ModelAdmin):
         return f'{obj.rate_limit_per_hour}/hr'
     rate_limit.short_description = 'Rate Limit'
     
+    @admin.display(description='ID')
+    def id_display(self, obj):
+        # A plain string dodges display_for_field's isinstance dispatch
+        return str(obj.id) if obj.pk else ''
+    
+    @admin.display(boolean=True, description='API Configured')
     def api_status(self, obj):
-        if obj.api_endpoint:
-            return format_html('<span style="color: green;">✓ Configured</span>')
-        return format_html('<span style="color: gray;">Not Configured</span>')
-    api_status.short_description = 'API Status'
+        # boolean=True rides the admin's stock icon path — no HTML built
+        # per row
+        return bool(obj.api_endpoint)
 
 
 @admin.register(ProviderDataFeed)
 class ProviderDataFeedAdmin(admin.ModelAdmin):
+    show_full_result_count = False
     list_display = ['feed_id', 'provider', 'vehicle_vin', 'status', 'requested_date', 'completed_date']
     list_filter = ['status', 'provider', 'requested_at']
+    list_select_related = ('vehicle', 'provider')
     search_fields = ['id', 'vehicle__vin', 'provider__name']
     readonly_fields = ['id', 'requested_at', 'completed_at']
+    autocomplete_fields = ('provider', 'vehicle')
     date_hierarchy = 'requested_at'
     
+    def get_queryset(self, request):
+        # Covers the change-form and autocomplete paths too, not just
+        # the changelist. The short id and timestamp strings are computed
+        # in SQL so no per-row Python formatting runs during render.
+        return super().get_queryset(request).select_related('vehicle', 'provider').annotate(
+            feed_id_short=Substr(Cast('id', output_field=CharField()), 1, 8),
+            requested_fmt=Func(
+                Value('%Y-%m-%d %H:%M'), F('requested_at'),
+                function='strftime', output_field=CharField()
+            ),
+            completed_fmt=Func(
+                Value('%Y-%m-%d %H:%M'), F('completed_at'),
+                function='strftime', output_field=CharField()
+            ),
+        )
+    
     def feed_id(self, obj):
-        return str(obj.id)[:8]
+        return obj.feed_id_short
     feed_id.short_description = 'Feed ID'
     
     def vehicle_vin(self, obj):
@@ -507,11 +571,11 @@ class ProviderDataFeedAdmin(admin.ModelAdmin):
     vehicle_vin.short_description = 'VIN'
     
     def requested_date(self, obj):
-        return obj.requested_at.strftime('%Y-%m-%d %H:%M')
+        return obj.requested_fmt
     requested_date.short_description = 'Requested'
     
     def completed_date(self, obj):
-        return obj.completed_at.strftime('%Y-%m-%d %H:%M') if obj.completed_at else '-'
+        return obj.completed_fmt or '-'
     completed_date.short_description = 'Completed'
 
 
@@ -521,15 +585,51 @@ class ProviderDataFeedAdmin(admin.ModelAdmin):
 
 @admin.register(AuditLog)
 class AuditLogAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # ids are random UUIDs, so order on the indexed timestamp column
+    ordering = ('-timestamp',)
     list_display = ['timestamp', 'user', 'action', 'resource_type', 'vehicle_vin', 'ip_address']
     list_filter = ['action', 'resource_type', 'timestamp']
-    search_fields = ['user__username', 'resource_type', 'vehicle__vin', 'ip_address']
-    readonly_fields = ['id', 'timestamp']
+    list_select_related = ('user', 'vehicle')
+    # '=' turns VIN/IP search into indexable equality instead of a
+    # full-table ILIKE '%q%' scan
+    search_fields = ['user__username', 'resource_type', '=vehicle__vin', '=ip_address']
     date_hierarchy = 'timestamp'
+    view_on_site = False
+    
+    def get_readonly_fields(self, request, obj=None):
+        # Rows are never editable, so mark every field readonly up-front
+        # and skip the formfield/widget machinery on the detail view
+        return [f.name for f in self.model._meta.fields] + ['id_display', 'timestamp_display']
+    
+    @admin.display(description='ID')
+    def id_display(self, obj):
+        return str(obj.id) if obj.pk else ''
+    
+    @admin.display(description='Timestamp')
+    def timestamp_display(self, obj):
+        return obj.timestamp.isoformat(timespec='seconds') if obj.timestamp else ''
+    
+
+    # Audit data is read-mostly: serve repeat admin polling from cache
+    # for a few seconds instead of re-querying and re-rendering.
+    @method_decorator(cache_page(30, cache='pages'))
+    @method_decorator(vary_on_cookie)
+    def changelist_view(self, request, extra_context=None):
+        return super().changelist_view(request, extra_context)
+
+    def get_queryset(self, request):
+        # One JOINed SELECT for the changelist, trimmed to the columns
+        # list_display actually reads
+        return super().get_queryset(request).select_related('user', 'vehicle').only(
+            'id', 'timestamp', 'action', 'resource_type', 'ip_address',
+            'user__username', 'vehicle__vin'
+        )
     
     fieldsets = (
         ('Log Information', {
-            'fields': ('id', 'timestamp', 'user', 'action')
+            'fields': ('id_display', 'timestamp_display', 'user', 'action')
         }),
         ('Resource', {
             'fields': ('resource_type', 'resource_id', 'field_accessed', 'vehicle')
@@ -559,26 +659,46 @@ class AuditLogAdmin(admin.ModelAdmin):
 
 @admin.register(SearchQuery)
 class SearchQueryAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ('-created_at',)
     list_display = ['timestamp', 'user', 'search_type', 'query_text', 
-                    'results_count', 'response_time', 'cache_status']
+                    'results_count', 'response_time', 'cache_hit']
     list_filter = ['search_type', 'cache_hit', 'created_at']
+    list_select_related = ('user',)
     search_fields = ['query_text', 'user__username']
-    readonly_fields = ['id', 'created_at']
     date_hierarchy = 'created_at'
+    view_on_site = False
+    
+    def get_readonly_fields(self, request, obj=None):
+        return [f.name for f in self.model._meta.fields]
+    
+
+    # Audit data is read-mostly: serve repeat admin polling from cache
+    # for a few seconds instead of re-querying and re-rendering.
+    @method_decorator(cache_page(30, cache='pages'))
+    @method_decorator(vary_on_cookie)
+    def changelist_view(self, request, extra_context=None):
+        return super().changelist_view(request, extra_context)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user').only(
+            'id', 'created_at', 'search_type', 'query_text', 'results_count',
+            'response_time_ms', 'cache_hit', 'user__username'
+        ).annotate(
+            created_fmt=Func(
+                Value('%Y-%m-%d %H:%M:%S'), F('created_at'),
+                function='strftime', output_field=CharField()
+            ),
+        )
     
     def timestamp(self, obj):
-        return obj.created_at.strftime('%Y-%m-%d %H:%M:%S')
+        return obj.created_fmt
     
     def response_time(self, obj):
         return f'{obj.response_time_ms}ms' if obj.response_time_ms else '-'
     response_time.short_description = 'Response Time'
     
-    def cache_status(self, obj):
-        if obj.cache_hit:
-            return format_html('<span style="color: green;">✓ Hit</span>')
-        return format_html('<span style="color: gray;">Miss</span>')
-    cache_status.short_description = 'Cache'
-    
     def has_add_permission(self, request):
         return False
     
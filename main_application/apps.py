@@ -1,6 +1,47 @@
+import atexit
+import logging
+import logging.handlers
+from pathlib import Path
+
 from django.apps import AppConfig
+from django.conf import settings
+
+_log_listener = None
 
 
 class MainApplicationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main_application'
+
+    def ready(self):
+        # Done here rather than at settings import so every management
+        # command and worker fork doesn't pay the stat+mkdir syscalls.
+        Path(settings.LOG_FILE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        self._start_log_listener()
+        from main_application import signals  # noqa: F401
+
+    def _start_log_listener(self):
+        """Drain LOGGING_QUEUE into the rotating log file.
+
+        Request handlers only do a queue put; this listener thread owns
+        the file writes so rotation never stalls a request.
+        """
+        global _log_listener
+        if _log_listener is not None:
+            return
+        file_handler = logging.handlers.RotatingFileHandler(
+            settings.LOG_FILE_PATH,
+            maxBytes=settings.LOG_FILE_MAX_BYTES,
+            backupCount=settings.LOG_FILE_BACKUP_COUNT,
+            delay=True,
+        )
+        file_handler.setFormatter(
+            logging.Formatter('{levelname} {asctime} {module} {message}', style='{')
+        )
+        _log_listener = logging.handlers.QueueListener(
+            settings.LOGGING_QUEUE, file_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        # Drain whatever is still queued when the process exits, so
+        # short-lived management commands don't lose their last records
+        atexit.register(_log_listener.stop)
@@ -0,0 +1,21 @@
+"""
+AutoSentinel HTTP Helpers
+orjson-backed JSON responses for the API hot paths
+"""
+
+import orjson
+from django.http import HttpResponse
+
+
+class OrjsonResponse(HttpResponse):
+    """JSON response serialized with orjson.
+
+    Several times faster than JsonResponse's json.dumps path and writes
+    bytes directly in C; datetimes are emitted natively without per-row
+    isoformat() calls. Types orjson doesn't know (e.g. Decimal) go
+    through ``default``.
+    """
+
+    def __init__(self, data, default=str, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(orjson.dumps(data, default=default), **kwargs)
@@ -0,0 +1,58 @@
+"""
+Django management command to move pre-split telemetry/audit/search data
+Usage: python manage.py migrate_telemetry_data
+
+One-shot upgrade step for databases created before the telemetry split:
+copies telemetry_traces, audit_logs and search_queries from the default
+database file into the telemetry database, then drops the stale tables
+from the default file. The stale copies must go — SQLite resolves
+unqualified table names through `main` before attached databases, so
+leftover tables would shadow the routed ones on the default connection.
+Safe to re-run; it does nothing once the tables are gone.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from main_application.models import AuditLog, SearchQuery, TelemetryTrace
+
+
+class Command(BaseCommand):
+    help = ('Moves pre-split telemetry/audit/search rows from the default '
+            'database file into the telemetry database')
+
+    def handle(self, *args, **options):
+        # The telemetry connection attaches the default file as appdb,
+        # so one connection sees both schemas
+        connection = connections['telemetry']
+        with connection.cursor() as cursor:
+            for model in (TelemetryTrace, AuditLog, SearchQuery):
+                table = model._meta.db_table
+                stale = cursor.execute(
+                    "SELECT name FROM appdb.sqlite_master "
+                    "WHERE type='table' AND name = %s",
+                    [table],
+                ).fetchone()
+                if stale is None:
+                    self.stdout.write(f'  - {table}: nothing to move')
+                    continue
+
+                # Copy by the column names both schemas share, in case
+                # the routed table has since gained columns
+                new_cols = [r[1] for r in cursor.execute(f'PRAGMA main.table_info({table})')]
+                old_cols = [r[1] for r in cursor.execute(f'PRAGMA appdb.table_info({table})')]
+                cols = ', '.join(c for c in new_cols if c in old_cols)
+
+                cursor.execute(
+                    f'INSERT OR IGNORE INTO main.{table} ({cols}) '
+                    f'SELECT {cols} FROM appdb.{table}'
+                )
+                moved = cursor.rowcount
+                cursor.execute(f'DROP TABLE appdb.{table}')
+                self.stdout.write(self.style.SUCCESS(f'  ✓ {table}: moved {moved} rows'))
+
+            # Moved tables need fresh statistics for the admin's
+            # estimated-count paginator
+            cursor.execute('ANALYZE')
+        
+        self.stdout.write(self.style.SUCCESS('Telemetry data migration complete'))
@@ -0,0 +1,31 @@
+"""
+Django management command to pre-populate the per-VIN snapshot cache
+Usage: python manage.py warm_vehicle_cache
+"""
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from main_application.models import Vehicle
+from main_application.views import (
+    VEHICLE_SNAPSHOT_FIELDS, VEHICLE_SNAPSHOT_TTL, vehicle_snapshot_entry,
+)
+
+
+class Command(BaseCommand):
+    help = 'Warms the per-VIN snapshot cache behind api_vehicle_lookup'
+
+    def handle(self, *args, **options):
+        rows = Vehicle.objects.values(*VEHICLE_SNAPSHOT_FIELDS, 'updated_at')
+        warmed = 0
+        batch = {}
+        for row in rows.iterator(chunk_size=1000):
+            batch[f"veh:{row['vin']}"] = vehicle_snapshot_entry(row)
+            if len(batch) >= 1000:
+                cache.set_many(batch, VEHICLE_SNAPSHOT_TTL)
+                warmed += len(batch)
+                batch = {}
+        if batch:
+            cache.set_many(batch, VEHICLE_SNAPSHOT_TTL)
+            warmed += len(batch)
+        self.stdout.write(self.style.SUCCESS(f'✓ Warmed {warmed} vehicle snapshots'))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-09-01 21:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_application', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='crowdsourcedreport',
+            index=models.Index(fields=['report_date'], name='crowdsource_report__371b93_idx'),
+        ),
+    ]
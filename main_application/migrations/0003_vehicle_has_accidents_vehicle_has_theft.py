@@ -0,0 +1,45 @@
+# Generated by Django 5.2.17 on 2026-09-01 21:56
+
+from django.db import migrations, models
+
+
+def backfill_badge_flags(apps, schema_editor):
+    """Set the flags for vehicles that already have child records; new
+    writes are kept in sync by signals."""
+    if schema_editor.connection.alias != 'default':
+        return
+    Vehicle = apps.get_model('main_application', 'Vehicle')
+    AccidentRecord = apps.get_model('main_application', 'AccidentRecord')
+    TheftRecord = apps.get_model('main_application', 'TheftRecord')
+    Vehicle.objects.filter(
+        pk__in=AccidentRecord.objects.values('vehicle_id')
+    ).update(has_accidents=True)
+    Vehicle.objects.filter(
+        pk__in=TheftRecord.objects.values('vehicle_id')
+    ).update(has_theft=True)
+
+
+def clear_badge_flags(apps, schema_editor):
+    # Columns are dropped on reverse; nothing to undo
+    pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_application', '0002_crowdsourcedreport_crowdsource_report__371b93_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vehicle',
+            name='has_accidents',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='vehicle',
+            name='has_theft',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(backfill_badge_flags, clear_badge_flags),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-09-01 21:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_application', '0003_vehicle_has_accidents_vehicle_has_theft'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='reportpurchase',
+            name='transaction_id',
+            field=models.CharField(blank=True, max_length=100, null=True, unique=True),
+        ),
+    ]
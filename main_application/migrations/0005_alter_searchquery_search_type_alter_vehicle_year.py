@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-09-01 22:04
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_application', '0004_alter_reportpurchase_transaction_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchquery',
+            name='search_type',
+            field=models.CharField(choices=[('vin', 'VIN'), ('plate', 'License Plate'), ('make_model', 'Make/Model')], db_index=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='vehicle',
+            name='year',
+            field=models.IntegerField(db_index=True, validators=[django.core.validators.MinValueValidator(1900), django.core.validators.MaxValueValidator(2100)]),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.17 on 2026-09-01 22:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main_application', '0005_alter_searchquery_search_type_alter_vehicle_year'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='user',
+            field=models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_logs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='auditlog',
+            name='vehicle',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_logs', to='main_application.vehicle'),
+        ),
+        migrations.AlterField(
+            model_name='searchquery',
+            name='user',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='searches', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='searchquery',
+            name='vehicle_found',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='searches', to='main_application.vehicle'),
+        ),
+        migrations.AlterField(
+            model_name='telemetrytrace',
+            name='vehicle',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='telemetry_traces', to='main_application.vehicle'),
+        ),
+    ]
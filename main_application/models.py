@@ -70,7 +70,7 @@ class Vehicle(models.Model):
     # Basic vehicle info
     make = models.CharField(max_length=100, db_index=True)
     model = models.CharField(max_length=100, db_index=True)
-    year = models.IntegerField(validators=[MinValueValidator(1900), MaxValueValidator(2100)])
+    year = models.IntegerField(validators=[MinValueValidator(1900), MaxValueValidator(2100)], db_index=True)
     trim = models.CharField(max_length=100, blank=True, null=True)
     body_style = models.CharField(max_length=50, blank=True, null=True)
     color = models.CharField(max_length=50, blank=True, null=True)
@@ -93,6 +93,11 @@ class Vehicle(models.Model):
     current_title_status = models.CharField(max_length=20, choices=TITLE_STATUS_CHOICES, default='clean')
     is_stolen = models.BooleanField(default=False, db_index=True)
     
+    # Denormalized badge flags kept in sync by signals on the child
+    # tables, so detail pages don't pay two exists() queries
+    has_accidents = models.BooleanField(default=False)
+    has_theft = models.BooleanField(default=False)
+    
     # Owner & consent info
     current_owner_count = models.IntegerField(default=1, validators=[MinValueValidator(1)])
     consenting_for_tracking = models.BooleanField(default=False, db_index=True)
@@ -358,7 +363,9 @@ class TelemetryTrace(models.Model):
     """GPS and telemetry data points (consent-required)"""
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE, related_name='telemetry_traces')
+    # Unenforced reference: this table lives in the telemetry database
+    # file (see TelemetryRouter), so the FK can't be a DB constraint
+    vehicle = models.ForeignKey(Vehicle, on_delete=models.CASCADE, related_name='telemetry_traces', db_constraint=False)
     
     timestamp = models.DateTimeField(db_index=True)
     
@@ -437,6 +444,7 @@ class CrowdsourcedReport(models.Model):
             models.Index(fields=['vehicle', 'status']),
             models.Index(fields=['report_type']),
             models.Index(fields=['status']),
+            models.Index(fields=['report_date']),
         ]
 
 
@@ -507,7 +515,7 @@ class ReportPurchase(models.Model):
     
     # Simulated payment details
     payment_method = models.CharField(max_length=50, default='credit_card')
-    transaction_id = models.CharField(max_length=100, blank=True, null=True)
+    transaction_id = models.CharField(max_length=100, blank=True, null=True, unique=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
@@ -606,7 +614,8 @@ class AuditLog(models.Model):
     ]
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='audit_logs')
+    # Cross-file references, unenforced like TelemetryTrace.vehicle
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='audit_logs', db_constraint=False)
     
     action = models.CharField(max_length=30, choices=ACTION_TYPES)
     resource_type = models.CharField(max_length=50)
@@ -614,7 +623,7 @@ class AuditLog(models.Model):
     
     # What was accessed
     field_accessed = models.CharField(max_length=100, blank=True, null=True)
-    vehicle = models.ForeignKey(Vehicle, on_delete=models.SET_NULL, null=True, blank=True, related_name='audit_logs')
+    vehicle = models.ForeignKey(Vehicle, on_delete=models.SET_NULL, null=True, blank=True, related_name='audit_logs', db_constraint=False)
     
     # Context
     ip_address = models.GenericIPAddressField(null=True, blank=True)
@@ -646,12 +655,13 @@ class SearchQuery(models.Model):
     ]
     
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='searches')
+    # Cross-file references, unenforced like TelemetryTrace.vehicle
+    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='searches', db_constraint=False)
     
-    search_type = models.CharField(max_length=20, choices=SEARCH_TYPES)
+    search_type = models.CharField(max_length=20, choices=SEARCH_TYPES, db_index=True)
     query_text = models.CharField(max_length=255, db_index=True)
     
-    vehicle_found = models.ForeignKey(Vehicle, on_delete=models.SET_NULL, null=True, blank=True, related_name='searches')
+    vehicle_found = models.ForeignKey(Vehicle, on_delete=models.SET_NULL, null=True, blank=True, related_name='searches', db_constraint=False)
     results_count = models.IntegerField(default=0)
     
     # Performance metrics
@@ -0,0 +1,17 @@
+"""
+AutoSentinel DRF Pagination
+Cursor-based pagination defaults for large append-only tables
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class TimestampCursorPagination(CursorPagination):
+    """Keyset pagination on the indexed created_at column.
+
+    Unlike PageNumberPagination this never issues COUNT(*) and fetches
+    deep pages in O(page_size) instead of O(offset) — important for
+    telemetry and audit tables that only ever grow.
+    """
+    ordering = '-created_at'
+    page_size = 20
@@ -0,0 +1,55 @@
+"""
+AutoSentinel Admin Paginators
+Cheap row-count estimates for huge append-only tables
+"""
+
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that avoids COUNT(*) over unfiltered audit-size tables.
+
+    When no filters are applied the exact count only feeds the page
+    widget, so the planner's estimate is good enough: reltuples on
+    PostgreSQL, the ANALYZE statistics on SQLite. Filtered querysets
+    (and databases without statistics) fall back to the real COUNT.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if hasattr(queryset, 'query') and not queryset.query.where:
+            estimate = self._estimated_row_count(queryset)
+            if estimate is not None:
+                return estimate
+        return super().count
+
+    def _estimated_row_count(self, queryset):
+        connection = connections[queryset.db]
+        table = queryset.model._meta.db_table
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    cursor.execute(
+                        'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                        [table],
+                    )
+                elif connection.vendor == 'sqlite':
+                    # sqlite_stat1.stat starts with the row count as of
+                    # the last ANALYZE
+                    cursor.execute(
+                        "SELECT CAST(substr(stat, 1, instr(stat || ' ', ' ') - 1) AS INTEGER) "
+                        'FROM sqlite_stat1 WHERE tbl = %s LIMIT 1',
+                        [table],
+                    )
+                else:
+                    return None
+                row = cursor.fetchone()
+        except DatabaseError:
+            # Statistics table missing or not readable; use the exact count
+            return None
+        if row and row[0]:
+            return int(row[0])
+        return None
@@ -0,0 +1,42 @@
+"""
+AutoSentinel Database Routers
+Routes high-write telemetry/audit tables onto their own SQLite file
+"""
+
+
+class TelemetryRouter:
+    """Send the append-heavy tables to the 'telemetry' database.
+
+    SQLite serializes writers per database file, so keeping telemetry
+    traces, audit logs and search queries out of the main file stops
+    their write bursts from stalling vehicle/report commits. The FKs
+    from these tables back to Vehicle/User become cross-file references
+    and are not enforced by the telemetry database.
+    """
+
+    route_app_labels = {'main_application'}
+    telemetry_models = {'telemetrytrace', 'auditlog', 'searchquery'}
+
+    def db_for_read(self, model, **hints):
+        if model._meta.model_name in self.telemetry_models:
+            return 'telemetry'
+        # Pin everything else to the default file, even when reached by
+        # traversing an FK from a telemetry-routed instance.
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        if model._meta.model_name in self.telemetry_models:
+            return 'telemetry'
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Cross-file relations are intentional (audit rows point at
+        # vehicles/users living in the default database).
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if model_name in self.telemetry_models:
+            return db == 'telemetry'
+        if db == 'telemetry':
+            return False
+        return None
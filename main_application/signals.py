@@ -0,0 +1,51 @@
+"""
+AutoSentinel Signal Receivers
+Keep the denormalized Vehicle badge flags and the per-VIN lookup
+snapshots in sync
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from main_application.models import AccidentRecord, TheftRecord, Vehicle
+
+
+@receiver(post_save, sender=Vehicle)
+def refresh_vehicle_snapshot(sender, instance, **kwargs):
+    # Keep the api_vehicle_lookup snapshot warm; the TTL bounds
+    # staleness from bulk queryset.update() paths that skip signals
+    from main_application.views import (
+        VEHICLE_SNAPSHOT_FIELDS, VEHICLE_SNAPSHOT_TTL, vehicle_snapshot_entry,
+    )
+    row = {field: getattr(instance, field) for field in VEHICLE_SNAPSHOT_FIELDS}
+    row['updated_at'] = instance.updated_at
+    cache.set(f'veh:{instance.vin}', vehicle_snapshot_entry(row), VEHICLE_SNAPSHOT_TTL)
+
+
+@receiver(post_delete, sender=Vehicle)
+def drop_vehicle_snapshot(sender, instance, **kwargs):
+    cache.delete(f'veh:{instance.vin}')
+
+
+@receiver(post_save, sender=AccidentRecord)
+def set_has_accidents(sender, instance, **kwargs):
+    # Targeted UPDATE, no model fetch
+    Vehicle.objects.filter(pk=instance.vehicle_id, has_accidents=False).update(has_accidents=True)
+
+
+@receiver(post_delete, sender=AccidentRecord)
+def clear_has_accidents(sender, instance, **kwargs):
+    if not AccidentRecord.objects.filter(vehicle_id=instance.vehicle_id).exists():
+        Vehicle.objects.filter(pk=instance.vehicle_id).update(has_accidents=False)
+
+
+@receiver(post_save, sender=TheftRecord)
+def set_has_theft(sender, instance, **kwargs):
+    Vehicle.objects.filter(pk=instance.vehicle_id, has_theft=False).update(has_theft=True)
+
+
+@receiver(post_delete, sender=TheftRecord)
+def clear_has_theft(sender, instance, **kwargs):
+    if not TheftRecord.objects.filter(vehicle_id=instance.vehicle_id).exists():
+        Vehicle.objects.filter(pk=instance.vehicle_id).update(has_theft=False)
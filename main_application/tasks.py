@@ -0,0 +1,66 @@
+"""
+AutoSentinel Celery Tasks
+Background jobs for report generation and maintenance
+"""
+
+from celery import shared_task
+from django.utils import timezone
+
+
+@shared_task
+def generate_vehicle_report(report_id):
+    """Assemble a vehicle report outside the request/response cycle.
+
+    The HTTP thread only inserts the pending row; everything expensive
+    happens here. Idempotent — re-running overwrites json_data and the
+    generation timestamps.
+    """
+    from main_application.models import VehicleReport
+
+    report = VehicleReport.objects.select_related('vehicle').get(id=report_id)
+    vehicle = report.vehicle
+
+    report.status = 'processing'
+    report.generation_started_at = timezone.now()
+    report.save(update_fields=['status', 'generation_started_at'])
+
+    json_data = {
+        'vin': vehicle.vin,
+        'make': vehicle.make,
+        'model': vehicle.model,
+        'year': vehicle.year,
+        'title_status': vehicle.current_title_status,
+        'mileage': vehicle.current_mileage,
+        'owners': vehicle.current_owner_count,
+        'is_stolen': vehicle.is_stolen,
+        'accidents': [
+            {
+                'accident_date': accident.accident_date.isoformat(),
+                'severity': accident.severity,
+                'source': accident.source,
+                'estimated_damage_cost': str(accident.estimated_damage_cost or ''),
+            }
+            for accident in vehicle.accidents.only(
+                'accident_date', 'severity', 'source', 'estimated_damage_cost'
+            )
+        ],
+    }
+    if report.include_owner_history:
+        json_data['owner_history'] = [
+            {
+                'owner_sequence': record.owner_sequence,
+                'owner_type': record.owner_type,
+                'ownership_start': record.ownership_start.isoformat(),
+                'ownership_end': record.ownership_end.isoformat() if record.ownership_end else None,
+            }
+            for record in vehicle.ownership_records.only(
+                'owner_sequence', 'owner_type', 'ownership_start', 'ownership_end'
+            )
+        ]
+    if report.include_telemetry:
+        json_data['telemetry_trace_count'] = vehicle.telemetry_traces.count()
+
+    report.json_data = json_data
+    report.status = 'completed'
+    report.generation_completed_at = timezone.now()
+    report.save(update_fields=['json_data', 'status', 'generation_completed_at'])
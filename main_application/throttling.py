@@ -0,0 +1,50 @@
+"""
+AutoSentinel DRF Throttling
+Pipelined Redis counters instead of the default get/set round-trips
+"""
+
+from django_redis import get_redis_connection
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+
+class PipelinedThrottleMixin:
+    """Rate-limit with a single pipelined INCR+EXPIRE.
+
+    DRF's SimpleRateThrottle does a cache.get plus cache.set per request
+    and the update is racy under concurrency. One atomic fixed-window
+    counter halves the Redis round-trips and can't lose increments.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        self.key = key
+        conn = get_redis_connection('default')
+        # SET NX seeds the counter with its expiry exactly once per
+        # window; expiring on every INCR would let a retrying client
+        # push its own lockout forward forever. The trailing EXPIRE NX
+        # only fires if the key somehow lost its TTL (expiry can lapse
+        # between the SET and the INCR), so a counter can never persist
+        # without a window.
+        pipe = conn.pipeline()
+        pipe.set(key, 0, ex=int(self.duration), nx=True)
+        pipe.incr(key)
+        pipe.expire(key, int(self.duration), nx=True)
+        _, count, _ = pipe.execute()
+        return count <= self.num_requests
+
+    def wait(self):
+        conn = get_redis_connection('default')
+        ttl = conn.ttl(self.key)
+        return ttl if ttl and ttl > 0 else None
+
+
+class PipelinedAnonRateThrottle(PipelinedThrottleMixin, AnonRateThrottle):
+    pass
+
+
+class PipelinedUserRateThrottle(PipelinedThrottleMixin, UserRateThrottle):
+    pass
@@ -49,4 +49,5 @@ urlpatterns = [
     # API Endpoints
     path('api/vehicle/<str:vin>/', views.api_vehicle_lookup, name='api_vehicle_lookup'),
     path('api/vehicle/<str:vin>/telemetry/', views.api_telemetry_data, name='api_telemetry_data'),
+    path('api/vehicles/telemetry/', views.api_bulk_telemetry, name='api_bulk_telemetry'),
 ]
\ No newline at end of file
@@ -3,17 +3,32 @@ AutoSentinel Django Views
 Complete view functions for vehicle history and monitoring system
 """
 
+from django.http import Http404, HttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth import login, logout, authenticate
 from django.contrib import messages
-from django.db.models import Q, Count, Avg, Max, Min
-from django.http import JsonResponse, HttpResponse
+from django.db import connections, transaction
+from django.db.models import Prefetch, Q, Count, Avg, Max, Min
 from django.utils import timezone
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from datetime import timedelta
+from django.core.signals import request_finished
+from django.dispatch import receiver
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+from django.views.decorators.http import condition
+from datetime import datetime, timedelta, timezone as dt_timezone
+import orjson
+from urllib.parse import urlencode
+import hashlib
 import json
+import secrets
+import threading
+import uuid
 
+from main_application.http import OrjsonResponse
+from main_application.tasks import generate_vehicle_report
 from main_application.models import (
     User, Vehicle, VehicleRegistration, TitleEvent, AccidentRecord,
     MileageRecord, OwnershipRecord, TheftRecord, TelemetryTrace,
@@ -35,9 +50,17 @@ def is_dealer(user):
 def is_fleet_admin(user):
     return user.is_authenticated and user.role in ['fleet_admin', 'system_admin']
 
+# Audit entries queue here during the request and are flushed in one
+# bulk_create when it finishes, so page views never wait on the write
+_audit_buffer = threading.local()
+
+
 def log_audit(user, action, resource_type, resource_id=None, vehicle=None, request=None):
     """Helper function to create audit logs"""
-    AuditLog.objects.create(
+    entries = getattr(_audit_buffer, 'entries', None)
+    if entries is None:
+        entries = _audit_buffer.entries = []
+    entries.append(AuditLog(
         user=user if user.is_authenticated else None,
         action=action,
         resource_type=resource_type,
@@ -45,7 +68,15 @@ def log_audit(user, action, resource_type, resource_id=None, vehicle=None, reque
         vehicle=vehicle,
         ip_address=request.META.get('REMOTE_ADDR') if request else None,
         user_agent=request.META.get('HTTP_USER_AGENT') if request else None
-    )
+    ))
+
+
+@receiver(request_finished)
+def _flush_audit_buffer(sender, **kwargs):
+    entries = getattr(_audit_buffer, 'entries', None)
+    if entries:
+        _audit_buffer.entries = []
+        AuditLog.objects.bulk_create(entries, batch_size=500)
 
 
 # ============================================================================
@@ -54,13 +85,25 @@ def log_audit(user, action, resource_type, resource_id=None, vehicle=None, reque
 
 def home(request):
     """Homepage"""
-    stats = {
-        'total_vehicles': Vehicle.objects.count(),
-        'total_reports': VehicleReport.objects.filter(status='completed').count(),
-        'stolen_vehicles': Vehicle.objects.filter(is_stolen=True).count(),
-        'tracked_vehicles': Vehicle.objects.filter(consenting_for_tracking=True).count(),
-    }
-    recent_searches = SearchQuery.objects.order_by('-created_at')[:5]
+    # The landing-page aggregates tolerate staleness; serve them from
+    # cache instead of four COUNT queries per anonymous hit
+    stats = cache.get('home:stats')
+    if stats is None:
+        stats = {
+            'total_vehicles': Vehicle.objects.count(),
+            'total_reports': VehicleReport.objects.filter(status='completed').count(),
+            'stolen_vehicles': Vehicle.objects.filter(is_stolen=True).count(),
+            'tracked_vehicles': Vehicle.objects.filter(consenting_for_tracking=True).count(),
+        }
+        cache.set('home:stats', stats, 60)
+    
+    # recent_searches stays uncached: the template needs model
+    # instances (timesince, get_search_type_display) which the msgpack
+    # cache serializer can't hold, and the query is an indexed LIMIT 5
+    # trimmed to the columns the homepage renders
+    recent_searches = SearchQuery.objects.only(
+        'query_text', 'search_type', 'results_count', 'created_at'
+    ).order_by('-created_at')[:5]
     
     return render(request, 'main_application/home.html', {
         'stats': stats,
@@ -139,23 +182,48 @@ def search_results(request):
     query = request.GET.get('q', '')
     search_type = request.GET.get('type', 'vin')
     
-    vehicles = []
+    vehicles = Vehicle.objects.none()
+    total_results = 0
     
     if query:
         start_time = timezone.now()
         
-        if search_type == 'vin':
-            vehicles = Vehicle.objects.filter(vin__icontains=query)
+        # Identical recent searches come straight from the cache as a
+        # VIN list and rehydrate through one indexed IN lookup
+        cache_key = f'search:{search_type}:{hashlib.md5(query.lower().encode()).hexdigest()}'
+        cached_vins = cache.get(cache_key)
+        cache_hit = cached_vins is not None
+        
+        if cache_hit:
+            vehicles = Vehicle.objects.filter(vin__in=cached_vins)
+        elif search_type == 'vin':
+            # A full 17-character VIN resolves through the unique index;
+            # only partial input pays the contains scan
+            if len(query) == 17:
+                vehicles = Vehicle.objects.filter(vin__iexact=query)
+            else:
+                vehicles = Vehicle.objects.filter(vin__icontains=query)
         elif search_type == 'plate':
-            registrations = VehicleRegistration.objects.filter(
-                plate_number__icontains=query
-            ).select_related('vehicle')
-            vehicles = [reg.vehicle for reg in registrations]
+            # Stay on a QuerySet so the paginator can slice in SQL
+            # instead of materializing every match
+            vehicles = Vehicle.objects.filter(
+                registrations__plate_number__icontains=query
+            ).distinct()
         elif search_type == 'make_model':
             vehicles = Vehicle.objects.filter(
                 Q(make__icontains=query) | Q(model__icontains=query)
             )
         
+        if not cache_hit:
+            cache.set(
+                cache_key,
+                list(vehicles.values_list('vin', flat=True)[:200]),
+                settings.SEARCH_CACHE_TTL,
+            )
+        
+        # One bounded COUNT instead of len() materializing the results
+        total_results = vehicles.count()
+        
         # Log search
         end_time = timezone.now()
         response_time = (end_time - start_time).total_seconds() * 1000
@@ -164,9 +232,10 @@ def search_results(request):
             user=request.user if request.user.is_authenticated else None,
             search_type=search_type,
             query_text=query,
-            vehicle_found=vehicles[0] if vehicles else None,
-            results_count=len(vehicles),
+            vehicle_found=vehicles.first() if total_results else None,
+            results_count=total_results,
             response_time_ms=int(response_time),
+            cache_hit=cache_hit,
             ip_address=request.META.get('REMOTE_ADDR')
         )
     
@@ -178,7 +247,7 @@ def search_results(request):
         'query': query,
         'search_type': search_type,
         'vehicles': vehicles_page,
-        'total_results': len(vehicles)
+        'total_results': total_results
     })
 
 
@@ -188,7 +257,12 @@ def search_results(request):
 
 def vehicle_list(request):
     """List all vehicles"""
-    vehicles = Vehicle.objects.all().order_by('-created_at')
+    # The listing renders a handful of columns; don't ship the wide
+    # spec/manufacturing fields for every row
+    vehicles = Vehicle.objects.only(
+        'vin', 'make', 'model', 'year', 'current_title_status',
+        'is_stolen', 'consenting_for_tracking', 'created_at'
+    ).order_by('-created_at')
     
     # Filters
     make = request.GET.get('make')
@@ -206,9 +280,18 @@ def vehicle_list(request):
     page = request.GET.get('page', 1)
     vehicles_page = paginator.get_page(page)
     
-    # Get filter options
-    makes = Vehicle.objects.values_list('make', flat=True).distinct().order_by('make')
-    years = Vehicle.objects.values_list('year', flat=True).distinct().order_by('-year')
+    # Get filter options; the DISTINCT scans change rarely, so hold
+    # them for an hour instead of rescanning the table per page load
+    makes = cache.get_or_set(
+        'vehicle_filter_makes',
+        lambda: list(Vehicle.objects.values_list('make', flat=True).distinct().order_by('make')),
+        3600,
+    )
+    years = cache.get_or_set(
+        'vehicle_filter_years',
+        lambda: list(Vehicle.objects.values_list('year', flat=True).distinct().order_by('-year')),
+        3600,
+    )
     
     return render(request, 'main_application/vehicle_list.html', {
         'vehicles': vehicles_page,
@@ -218,29 +301,36 @@ def vehicle_list(request):
 
 def vehicle_detail(request, vin):
     """Vehicle detail page"""
-    vehicle = get_object_or_404(Vehicle, vin=vin)
+    # One prefetch batch instead of six lazy related queries; the badge
+    # flags reuse the prefetched lists rather than issuing exists()
+    vehicle = get_object_or_404(
+        Vehicle.objects.prefetch_related(
+            Prefetch('registrations', queryset=VehicleRegistration.objects.order_by('-issued_date')),
+            Prefetch('title_events', queryset=TitleEvent.objects.all()[:10], to_attr='recent_title_events'),
+            Prefetch('accidents', queryset=AccidentRecord.objects.all()[:10], to_attr='recent_accidents'),
+            Prefetch('mileage_records', queryset=MileageRecord.objects.all()[:20], to_attr='recent_mileage_records'),
+            'ownership_records',
+            'theft_records',
+        ),
+        vin=vin,
+    )
     
     # Log view
     log_audit(request.user, 'view', 'Vehicle', vehicle.id, vehicle, request)
     
-    # Get related data
-    registrations = vehicle.registrations.all().order_by('-issued_date')
-    title_events = vehicle.title_events.all()[:10]
-    accidents = vehicle.accidents.all()[:10]
-    mileage_records = vehicle.mileage_records.all()[:20]
-    ownership_records = vehicle.ownership_records.all()
+    # All served from the prefetch cache
     theft_records = vehicle.theft_records.all()
     
     context = {
         'vehicle': vehicle,
-        'registrations': registrations,
-        'title_events': title_events,
-        'accidents': accidents,
-        'mileage_records': mileage_records,
-        'ownership_records': ownership_records,
+        'registrations': vehicle.registrations.all(),
+        'title_events': vehicle.recent_title_events,
+        'accidents': vehicle.recent_accidents,
+        'mileage_records': vehicle.recent_mileage_records,
+        'ownership_records': vehicle.ownership_records.all(),
         'theft_records': theft_records,
-        'has_accidents': accidents.exists(),
-        'has_theft': theft_records.exists(),
+        'has_accidents': vehicle.has_accidents,
+        'has_theft': vehicle.has_theft,
     }
     
     return render(request, 'main_application/vehicle_detail.html', context)
@@ -265,8 +355,14 @@ def vehicle_tracking(request, vin):
         messages.warning(request, 'This vehicle does not have tracking enabled')
         return redirect('vehicle_detail', vin=vin)
     
-    # Get recent telemetry
-    telemetry = vehicle.telemetry_traces.all()[:100]
+    # Get recent telemetry as plain dicts: the map needs a handful of
+    # columns, so skip model instantiation for the 100 rows
+    telemetry = list(
+        vehicle.telemetry_traces.order_by('-timestamp').values(
+            'latitude', 'longitude', 'timestamp', 'speed',
+            'heading', 'altitude', 'odometer'
+        )[:100]
+    )
     
     return render(request, 'main_application/vehicle_tracking.html', {
         'vehicle': vehicle,
@@ -286,15 +382,17 @@ def generate_report(request, vin):
     if request.method == 'POST':
         include_telemetry = request.POST.get('include_telemetry') == 'on'
         
-        # Create report
+        # Create the pending row and hand the heavy assembly to Celery
+        # so this request returns after one INSERT
         report = VehicleReport.objects.create(
             vehicle=vehicle,
             requested_by=request.user,
-            status='processing',
+            status='pending',
             price=29.99,
             include_telemetry=include_telemetry and vehicle.consenting_for_tracking,
             include_owner_history=True
         )
+        generate_vehicle_report.delay(str(report.id))
         
         messages.success(request, 'Report generation started!')
         return redirect('report_detail', report_id=report.id)
@@ -308,7 +406,10 @@ def report_list(request):
     """List user's reports"""
     reports = VehicleReport.objects.filter(
         requested_by=request.user
-    ).select_related('vehicle').order_by('-created_at')
+    ).select_related('vehicle').only(
+        'status', 'is_paid', 'price', 'created_at',
+        'vehicle__vin', 'vehicle__make', 'vehicle__model', 'vehicle__year'
+    ).order_by('-created_at')
     
     paginator = Paginator(reports, 20)
     page = request.GET.get('page', 1)
@@ -321,12 +422,12 @@ def report_list(request):
 @login_required
 def report_detail(request, report_id):
     """View report details"""
-    report = get_object_or_404(VehicleReport, id=report_id)
-    
-    # Check access
-    if report.requested_by != request.user and not is_admin(request.user):
-        messages.error(request, 'You do not have access to this report')
-        return redirect('report_list')
+    # Fold the access check into the lookup: non-admins can only resolve
+    # their own reports, so unauthorized ids 404 from the same query
+    reports = VehicleReport.objects.select_related('vehicle', 'requested_by')
+    if not is_admin(request.user):
+        reports = reports.filter(requested_by=request.user)
+    report = get_object_or_404(reports, id=report_id)
     
     return render(request, 'main_application/report_detail.html', {
         'report': report
@@ -338,20 +439,23 @@ def purchase_report(request, report_id):
     report = get_object_or_404(VehicleReport, id=report_id)
     
     if request.method == 'POST':
-        # Simulate payment
-        ReportPurchase.objects.create(
-            report=report,
-            user=request.user,
-            amount=report.price,
-            payment_status='completed',
-            payment_method='credit_card',
-            transaction_id=f'TXN{timezone.now().timestamp()}',
-            completed_at=timezone.now()
-        )
-        
-        report.is_paid = True
-        report.status = 'completed'
-        report.save()
+        # Simulate payment; the flag flip is a targeted UPDATE instead
+        # of re-saving every column of the fetched row
+        with transaction.atomic():
+            ReportPurchase.objects.create(
+                report=report,
+                user=request.user,
+                amount=report.price,
+                payment_status='completed',
+                payment_method='credit_card',
+                # Random token instead of a clock float: collision-safe under
+                # concurrency and probe-able through the unique index
+                transaction_id=f'TXN{secrets.token_urlsafe(16)}',
+                completed_at=timezone.now()
+            )
+            VehicleReport.objects.filter(pk=report.pk).update(
+                is_paid=True, status='completed'
+            )
         
         messages.success(request, 'Report purchased successfully!')
         return redirect('report_detail', report_id=report.id)
@@ -373,10 +477,23 @@ def dashboard(request):
     recent_searches = SearchQuery.objects.filter(user=user).order_by('-created_at')[:10]
     recent_reports = VehicleReport.objects.filter(requested_by=user).order_by('-created_at')[:5]
     
+    # One statement instead of three COUNT round-trips. It runs on the
+    # telemetry connection, which attaches the main database, so the
+    # subselects can span both files.
+    with connections['telemetry'].cursor() as cursor:
+        cursor.execute(
+            'SELECT '
+            '(SELECT COUNT(*) FROM search_queries WHERE user_id = %s), '
+            '(SELECT COUNT(*) FROM vehicle_reports WHERE requested_by_id = %s), '
+            '(SELECT COUNT(*) FROM report_purchases WHERE user_id = %s)',
+            [user.pk, user.pk, user.pk],
+        )
+        total_searches, total_reports, total_purchases = cursor.fetchone()
+    
     stats = {
-        'total_searches': SearchQuery.objects.filter(user=user).count(),
-        'total_reports': VehicleReport.objects.filter(requested_by=user).count(),
-        'total_purchases': ReportPurchase.objects.filter(user=user).count(),
+        'total_searches': total_searches,
+        'total_reports': total_reports,
+        'total_purchases': total_purchases,
     }
     
     return render(request, 'main_application/dashboard.html', {
@@ -394,7 +511,11 @@ def profile(request):
         request.user.email = request.POST.get('email', '')
         request.user.phone_number = request.POST.get('phone_number', '')
         request.user.company_name = request.POST.get('company_name', '')
-        request.user.save()
+        # Write just the edited columns; a bare save() rewrites the full
+        # row (password, flags, last_login) and fires wider signals
+        request.user.save(update_fields=[
+            'first_name', 'last_name', 'email', 'phone_number', 'company_name',
+        ])
         
         messages.success(request, 'Profile updated successfully')
         return redirect('profile')
@@ -457,13 +578,18 @@ def crowdsourced_reports(request):
 @user_passes_test(is_admin)
 def admin_dashboard(request):
     """Admin dashboard"""
-    stats = {
-        'total_vehicles': Vehicle.objects.count(),
-        'total_users': User.objects.count(),
-        'total_reports': VehicleReport.objects.count(),
-        'stolen_vehicles': Vehicle.objects.filter(is_stolen=True).count(),
-        'pending_crowdsourced': CrowdsourcedReport.objects.filter(status='pending').count(),
-    }
+    # Five COUNT queries per reload is waste for numbers that tolerate
+    # 30s of staleness
+    stats = cache.get('admin_dashboard:stats')
+    if stats is None:
+        stats = {
+            'total_vehicles': Vehicle.objects.count(),
+            'total_users': User.objects.count(),
+            'total_reports': VehicleReport.objects.count(),
+            'stolen_vehicles': Vehicle.objects.filter(is_stolen=True).count(),
+            'pending_crowdsourced': CrowdsourcedReport.objects.filter(status='pending').count(),
+        }
+        cache.set('admin_dashboard:stats', stats, 30)
     
     recent_activity = AuditLog.objects.select_related('user', 'vehicle').order_by('-timestamp')[:20]
     
@@ -475,7 +601,10 @@ def admin_dashboard(request):
 @user_passes_test(is_admin)
 def audit_logs(request):
     """View audit logs"""
-    logs = AuditLog.objects.select_related('user', 'vehicle').order_by('-timestamp')
+    logs = AuditLog.objects.select_related('user', 'vehicle').only(
+        'action', 'resource_type', 'resource_id', 'ip_address', 'timestamp',
+        'user__username', 'vehicle__vin'
+    ).order_by('-timestamp', '-id')
     
     # Filters
     action = request.GET.get('action')
@@ -486,18 +615,54 @@ def audit_logs(request):
     if user_id:
         logs = logs.filter(user_id=user_id)
     
-    paginator = Paginator(logs, 50)
-    page = request.GET.get('page', 1)
-    logs_page = paginator.get_page(page)
+    # Keyset pagination: OFFSET pages scan and discard every earlier
+    # row, while a cursor rides the index at any depth. The cursor is
+    # "<timestamp>_<pk>" — the pk tiebreaker stops rows sharing the
+    # boundary timestamp from being skipped between pages.
+    before = request.GET.get('before')
+    if before:
+        timestamp_part, _, pk_part = before.rpartition('_')
+        # parse_datetime raises on well-formed strings with invalid
+        # values (month 13 etc.); treat those like any other garbage
+        # cursor instead of 500ing
+        try:
+            cursor_ts = parse_datetime(timestamp_part) if timestamp_part else None
+        except ValueError:
+            cursor_ts = None
+        if cursor_ts is not None:
+            try:
+                cursor_pk = uuid.UUID(pk_part)
+            except ValueError:
+                cursor_pk = None
+            tail = Q(timestamp__lt=cursor_ts)
+            if cursor_pk is not None:
+                tail |= Q(timestamp=cursor_ts, id__lt=cursor_pk)
+            logs = logs.filter(tail)
+    
+    # Fetch one extra row to learn whether an older page exists
+    page_rows = list(logs[:51])
+    if len(page_rows) == 51:
+        boundary = page_rows[49]
+        next_cursor = f'{boundary.timestamp.isoformat()}_{boundary.id.hex}'
+    else:
+        next_cursor = None
+    
+    filter_params = urlencode([(k, v) for k, v in (('action', action), ('user', user_id)) if v])
     
     return render(request, 'main_application/audit_logs.html', {
-        'logs': logs_page
+        'logs': page_rows[:50],
+        'next_cursor': next_cursor,
+        'before': before,
+        'filter_params': filter_params,
     })
 
 @user_passes_test(is_admin)
 def stolen_vehicles(request):
     """Manage stolen vehicles"""
-    vehicles = Vehicle.objects.filter(is_stolen=True).select_related().order_by('-updated_at')
+    vehicles = Vehicle.objects.filter(is_stolen=True).only(
+        'vin', 'make', 'model', 'year', 'consenting_for_tracking',
+        'is_stolen', 'updated_at'
+    ).prefetch_related('theft_records').order_by('-updated_at')
     
     return render(request, 'main_application/stolen_vehicles.html', {
         'vehicles': vehicles
@@ -535,67 +700,205 @@ def verify_report(request, report_id):
 @login_required
 def statistics(request):
     """Statistics and analytics"""
+    # Analytics tolerate a minute of staleness; serve the whole block
+    # from cache instead of re-aggregating three tables per request
+    cached = cache.get('stats:v1')
+    if cached is not None:
+        return render(request, 'main_application/statistics.html', cached)
+    
     # Vehicle stats
     vehicle_stats = {
-        'by_make': Vehicle.objects.values('make').annotate(count=Count('id')).order_by('-count')[:10],
-        'by_year': Vehicle.objects.values('year').annotate(count=Count('id')).order_by('-year')[:10],
-        'by_status': Vehicle.objects.values('current_title_status').annotate(count=Count('id')),
+        'by_make': list(Vehicle.objects.values('make').annotate(count=Count('pk')).order_by('-count')[:10]),
+        'by_year': list(Vehicle.objects.values('year').annotate(count=Count('pk')).order_by('-year')[:10]),
+        'by_status': list(Vehicle.objects.values('current_title_status').annotate(count=Count('pk'))),
     }
     
-    # Accident stats
+    # Accident stats — the group-by already scans the table, so derive
+    # the total from it instead of a second COUNT round-trip
+    accidents_by_severity = list(
+        AccidentRecord.objects.values('severity').annotate(count=Count('pk'))
+    )
     accident_stats = {
-        'total': AccidentRecord.objects.count(),
-        'by_severity': AccidentRecord.objects.values('severity').annotate(count=Count('id')),
+        'total': sum(row['count'] for row in accidents_by_severity),
+        'by_severity': accidents_by_severity,
     }
     
     # Search stats
+    searches_by_type = list(
+        SearchQuery.objects.values('search_type').annotate(count=Count('pk'))
+    )
     search_stats = {
-        'total': SearchQuery.objects.count(),
-        'by_type': SearchQuery.objects.values('search_type').annotate(count=Count('id')),
+        'total': sum(row['count'] for row in searches_by_type),
+        'by_type': searches_by_type,
     }
     
-    return render(request, 'main_application/statistics.html', {
+    context = {
         'vehicle_stats': vehicle_stats,
         'accident_stats': accident_stats,
         'search_stats': search_stats
-    })
+    }
+    cache.set('stats:v1', context, 60)
+    
+    return render(request, 'main_application/statistics.html', context)
 
 
 # ============================================================================
 # API VIEWS (JSON)
 # ============================================================================
 
+# Columns and payload shape for the per-VIN lookup snapshot; signals on
+# Vehicle keep the cached copies warm so hot reads bypass the ORM
+VEHICLE_SNAPSHOT_FIELDS = (
+    'vin', 'make', 'model', 'year', 'current_title_status',
+    'current_mileage', 'is_stolen',
+)
+VEHICLE_SNAPSHOT_TTL = 600
+
+
+def vehicle_snapshot(row):
+    """API payload for a vehicle lookup, from a values() row."""
+    return {
+        'vin': row['vin'],
+        'make': row['make'],
+        'model': row['model'],
+        'year': row['year'],
+        'title_status': row['current_title_status'],
+        'mileage': row['current_mileage'],
+        'is_stolen': row['is_stolen'],
+    }
+
+
+def vehicle_snapshot_entry(row):
+    """Pre-serialized body plus its ETag, cached together so one cache
+    fetch serves both the conditional check and the response with no
+    database work."""
+    body = orjson.dumps(vehicle_snapshot(row))
+    etag = hashlib.md5(
+        f"{row['vin']}:{row['updated_at'].isoformat()}".encode()
+    ).hexdigest()
+    return [body, etag]
+
+
+def _vehicle_etag(request, vin):
+    """ETag from the cached snapshot entry; lets polling clients get
+    304s without a query. The fetched entry is stashed on the request
+    so the view doesn't hit the cache a second time."""
+    entry = cache.get(f'veh:{vin}')
+    if entry is not None:
+        request._vehicle_snapshot_entry = entry
+        if entry == '__404__':
+            return None
+        return entry[1]
+    return None
+
+
+@condition(etag_func=_vehicle_etag)
 def api_vehicle_lookup(request, vin):
     """API endpoint for vehicle lookup"""
-    try:
-        vehicle = Vehicle.objects.get(vin=vin)
-        data = {
-            'vin': vehicle.vin,
-            'make': vehicle.make,
-            'model': vehicle.model,
-            'year': vehicle.year,
-            'title_status': vehicle.current_title_status,
-            'mileage': vehicle.current_mileage,
-            'is_stolen': vehicle.is_stolen,
-        }
-        return JsonResponse(data)
-    except Vehicle.DoesNotExist:
-        return JsonResponse({'error': 'Vehicle not found'}, status=404)
+    # Cache hits (including a short-lived negative entry for unknown
+    # VINs) keep scan traffic off the database entirely
+    cache_key = f'veh:{vin}'
+    cached = getattr(request, '_vehicle_snapshot_entry', None)
+    if cached == '__404__':
+        return OrjsonResponse({'error': 'Vehicle not found'}, status=404)
+    if cached is not None:
+        # Pre-serialized bytes: no JSON encoding on the hot path
+        return HttpResponse(cached[0], content_type='application/json')
+    
+    # Only the serialized columns leave the database; branching on None
+    # keeps exception construction off the VIN-scan path
+    row = Vehicle.objects.filter(vin=vin).values(
+        *VEHICLE_SNAPSHOT_FIELDS, 'updated_at'
+    ).first()
+    
+    if row is None:
+        cache.set(cache_key, '__404__', 60)
+        return OrjsonResponse({'error': 'Vehicle not found'}, status=404)
+    
+    entry = vehicle_snapshot_entry(row)
+    cache.set(cache_key, entry, VEHICLE_SNAPSHOT_TTL)
+    response = HttpResponse(entry[0], content_type='application/json')
+    response['ETag'] = f'"{entry[1]}"'
+    return response
 
 @login_required
 def api_telemetry_data(request, vin):
     """API endpoint for telemetry data"""
-    vehicle = get_object_or_404(Vehicle, vin=vin)
+    # Two columns answer both the 404 and the consent check; denied
+    # lookups never hydrate a Vehicle instance
+    row = Vehicle.objects.filter(vin=vin).values('id', 'consenting_for_tracking').first()
+    if row is None:
+        raise Http404
+    
+    if not row['consenting_for_tracking']:
+        return OrjsonResponse({'error': 'Tracking not enabled'}, status=403)
+    
+    # Value dicts skip model hydration, and orjson emits the datetimes
+    # natively instead of paying isoformat() per row
+    traces = TelemetryTrace.objects.filter(vehicle_id=row['id']).order_by('-timestamp')
+    
+    # Keyset pagination: ?before= takes the epoch-ms cursor from the
+    # previous page (ISO datetimes also accepted) and rides the
+    # (vehicle, -timestamp) index at any depth
+    before = request.GET.get('before')
+    if before:
+        # Garbage cursors (out-of-range epochs, invalid date values)
+        # are ignored rather than 500ing the endpoint
+        try:
+            if before.isdigit():
+                cursor = datetime.fromtimestamp(int(before) / 1000, tz=dt_timezone.utc)
+            else:
+                cursor = parse_datetime(before)
+        except (ValueError, OverflowError):
+            cursor = None
+        if cursor is not None:
+            traces = traces.filter(timestamp__lt=cursor)
+    
+    traces = traces.values('timestamp', 'latitude', 'longitude', 'speed')[:100]
+    # Epoch milliseconds: one integer instead of an ISO string
+    # allocation per row; clients needing ISO convert on their side.
+    # iterator() streams the rows without retaining a result cache for
+    # the rest of the view's lifetime.
+    # Decimals pass straight through; orjson converts them via the
+    # default hook in its C loop instead of a float() call per field
+    data = [{
+        'timestamp': int(trace['timestamp'].timestamp() * 1000),
+        'latitude': trace['latitude'],
+        'longitude': trace['longitude'],
+        'speed': trace['speed'],
+    } for trace in traces.iterator(chunk_size=100)]
     
-    if not vehicle.consenting_for_tracking:
-        return JsonResponse({'error': 'Tracking not enabled'}, status=403)
+    next_cursor = data[-1]['timestamp'] if len(data) == 100 else None
+    return OrjsonResponse({'data': data, 'next': next_cursor}, default=float)
+
+@login_required
+def api_bulk_telemetry(request):
+    """API endpoint for telemetry across several vehicles at once"""
+    vins = [v for v in request.GET.get('vins', '').split(',') if v]
+    if not vins:
+        return OrjsonResponse({'error': 'No VINs supplied'}, status=400)
+    
+    # One prefetch round-trip for every requested vehicle instead of a
+    # per-VIN call fan-out; the sliced queryset caps each vehicle at 100
+    # rows in SQL (window function partitioned per parent)
+    vehicles = Vehicle.objects.filter(
+        vin__in=vins, consenting_for_tracking=True
+    ).prefetch_related(
+        Prefetch(
+            'telemetry_traces',
+            queryset=TelemetryTrace.objects.order_by('-timestamp')[:100],
+            to_attr='recent_traces',
+        )
+    )
     
-    traces = vehicle.telemetry_traces.all()[:100]
-    data = [{
-        'timestamp': trace.timestamp.isoformat(),
-        'latitude': float(trace.latitude),
-        'longitude': float(trace.longitude),
-        'speed': trace.speed,
-    } for trace in traces]
+    payload = {
+        vehicle.vin: [{
+            'timestamp': int(trace.timestamp.timestamp() * 1000),
+            'latitude': trace.latitude,
+            'longitude': trace.longitude,
+            'speed': trace.speed,
+        } for trace in vehicle.recent_traces]
+        for vehicle in vehicles
+    }
     
-    return JsonResponse({'data': data})
\ No newline at end of file
+    return OrjsonResponse({'data': payload}, default=float)
\ No newline at end of file